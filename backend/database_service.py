@@ -1,10 +1,12 @@
 import asyncpg
 import asyncio
-import json
+import hashlib
+import orjson
 import os
 from typing import Optional, List, Dict, Any, Union
-from datetime import datetime, timedelta
-from asyncio_throttle import Throttler
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from contextlib import asynccontextmanager
 import uuid
 import logging
 from dotenv import load_dotenv
@@ -13,16 +15,237 @@ load_dotenv()  # Load environment variables explicitly
 
 logger = logging.getLogger(__name__)
 
+# Insertable news_cache columns, in the order produced by _news_row
+NEWS_CACHE_COLUMNS = (
+    'article_id', 'title', 'summary', 'url', 'source', 'published_at',
+    'category', 'sentiment', 'trending_potential', 'tags',
+    'social_engagement', 'content_hash', 'agent_source', 'raw_data'
+)
+
+# Articles are deduplicated against copies fetched within this window. It must
+# stay shorter than news_cache's compress_after, so that the content_hash
+# lookups only touch uncompressed chunks.
+NEWS_DEDUP_WINDOW = "INTERVAL '1 day'"
+
+# Hot-path statements are kept as constants: asyncpg prepares each distinct
+# query text once per connection and reuses the plan on later calls.
+CACHE_NEWS_ARTICLE_SQL = f"""
+    WITH updated AS (
+        UPDATE news_cache SET
+            last_updated = NOW(),
+            social_engagement = $11::jsonb,
+            trending_potential = $9::integer
+        WHERE content_hash = $12::text
+        AND fetch_timestamp >= NOW() - {NEWS_DEDUP_WINDOW}
+        RETURNING id
+    ), inserted AS (
+        INSERT INTO news_cache (
+            article_id, title, summary, url, source, published_at,
+            category, sentiment, trending_potential, tags,
+            social_engagement, content_hash, agent_source, raw_data
+        )
+        SELECT $1::text, $2::text, $3::text, $4::text, $5::text, $6::timestamptz,
+               $7::text, $8::text, $9::integer, $10::text[],
+               $11::jsonb, $12::text, $13::text, $14::jsonb
+        WHERE NOT EXISTS (SELECT 1 FROM updated)
+        RETURNING id
+    )
+    SELECT id FROM updated
+    UNION ALL
+    SELECT id FROM inserted
+    LIMIT 1
+"""
+
+SCHEDULE_SOCIAL_CONTENT_SQL = """
+    INSERT INTO social_content_schedule (
+        content_id, platform, content_type, title, content_text,
+        media_urls, hashtags, scheduled_time, campaign_id,
+        target_audience, ai_generated, source_news_id
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)
+    RETURNING id
+"""
+
+MARK_CONTENT_POSTED_SQL = """
+    UPDATE social_content_schedule SET
+        status = $1, posted_at = NOW(), engagement_data = $2
+    WHERE id = $3
+"""
+
+UPDATE_CONTENT_STATUS_SQL = """
+    UPDATE social_content_schedule SET status = $1
+    WHERE id = $2
+"""
+
+# Metrics are buffered and written with COPY; see record_content_metric
+CONTENT_METRIC_COLUMNS = ('content_id', 'metric_name', 'metric_value', 'platform', 'recorded_at')
+METRIC_FLUSH_INTERVAL = 1.0  # seconds
+METRIC_QUEUE_LIMIT = 100_000
+
+AGENT_RESPONSE_PURGE_INTERVAL = 600  # seconds
+
+PURGE_AGENT_RESPONSES_SQL = """
+    DELETE FROM agent_response_cache WHERE expires_at < NOW()
+"""
+
+INSERT_CONTENT_METRIC_SQL = """
+    INSERT INTO content_analytics (content_id, metric_name, metric_value, platform)
+    VALUES ($1, $2, $3, $4)
+"""
+
+INSERT_QUEUED_METRIC_SQL = """
+    INSERT INTO content_analytics (content_id, metric_name, metric_value, platform, recorded_at)
+    VALUES ($1, $2, $3, $4, $5)
+"""
+
+# Failures that say nothing about the rows themselves; metrics that hit one
+# are requeued for the next flush
+METRIC_RETRYABLE_ERRORS = (OSError, asyncio.TimeoutError,
+                           asyncpg.PostgresConnectionError, asyncpg.InterfaceError)
+
+FIND_CACHED_NEWS_HASHES_SQL = f"""
+    SELECT DISTINCT ON (content_hash) content_hash, id
+    FROM news_cache
+    WHERE content_hash = ANY($1::text[])
+    AND fetch_timestamp >= NOW() - {NEWS_DEDUP_WINDOW}
+"""
+
+REFRESH_CACHED_NEWS_SQL = f"""
+    UPDATE news_cache SET
+        last_updated = NOW(),
+        social_engagement = $1,
+        trending_potential = $2
+    WHERE content_hash = $3
+    AND fetch_timestamp >= NOW() - {NEWS_DEDUP_WINDOW}
+"""
+
+GET_AGENT_RESPONSE_SQL = """
+    SELECT response, EXTRACT(EPOCH FROM expires_at - NOW())::float8 AS ttl_remaining
+    FROM agent_response_cache
+    WHERE query_hash = $1 AND expires_at > NOW()
+"""
+
+CACHE_AGENT_RESPONSE_SQL = """
+    INSERT INTO agent_response_cache (query_hash, response, expires_at)
+    VALUES ($1, $2, NOW() + make_interval(secs => $3::integer))
+    ON CONFLICT (query_hash) DO UPDATE SET
+        response = EXCLUDED.response,
+        created_at = NOW(),
+        expires_at = EXCLUDED.expires_at
+"""
+
+# Readers take optional filters as nullable parameters so that each one is a
+# single statement text for asyncpg's per-connection prepared statement cache.
+# Columns are aliased to the keys the API returns so rows convert with dict().
+GET_CACHED_NEWS_SQL = """
+    SELECT article_id AS id, title, summary, url, source,
+           published_at AS "publishedAt", category, sentiment, trending_potential,
+           COALESCE(tags, '{}') AS tags,
+           COALESCE(social_engagement, '{}') AS social_engagement,
+           fetch_timestamp AS cached_at, id::text AS cache_id, agent_source
+    FROM news_cache
+    WHERE fetch_timestamp >= NOW() - make_interval(hours => $1::integer)
+    AND (expiry_date IS NULL OR expiry_date > NOW())
+    AND ($2::text IS NULL OR category = $2::text)
+    AND ($4::timestamptz IS NULL OR fetch_timestamp < $4::timestamptz
+         OR (fetch_timestamp = $4::timestamptz AND id < $5::uuid))
+    ORDER BY news_cache.fetch_timestamp DESC, news_cache.id DESC
+    LIMIT $3
+"""
+
+GET_SCHEDULED_CONTENT_SQL = """
+    SELECT sc.id::text AS id, sc.content_id, sc.platform, sc.content_type,
+           sc.title, sc.content_text,
+           COALESCE(sc.media_urls, '{}') AS media_urls,
+           COALESCE(sc.hashtags, '{}') AS hashtags,
+           sc.scheduled_time, sc.status, sc.campaign_id, sc.ai_generated,
+           sc.source_news_id
+    FROM social_content_schedule sc
+    WHERE sc.status = $1
+    AND ($2::text IS NULL OR sc.platform = $2::text)
+    AND ($4::timestamptz IS NULL OR sc.scheduled_time > $4::timestamptz
+         OR (sc.scheduled_time = $4::timestamptz AND sc.id > $5::uuid))
+    ORDER BY sc.scheduled_time ASC, sc.id ASC
+    LIMIT $3
+"""
+
+GET_SOURCE_NEWS_SQL = """
+    SELECT id, title, url FROM news_cache
+    WHERE id = ANY($1::uuid[])
+"""
+
+GET_TRENDING_TOPICS_HOURLY_SQL = """
+    SELECT NULL::text AS id, topic, category,
+           MAX(peak_score) AS trending_score,
+           SUM(mentions)::bigint AS mention_count,
+           COALESCE(AVG(avg_sentiment), 0)::float8 AS sentiment_score,
+           MIN(first_detected) AS first_detected,
+           MAX(last_seen) AS last_updated,
+           '{}'::text[] AS related_keywords
+    FROM trending_topics_hourly
+    WHERE bucket >= time_bucket('1 hour', NOW() - make_interval(hours => $1::integer))
+    AND ($2::text IS NULL OR category = $2::text)
+    GROUP BY topic, category
+    ORDER BY trending_score DESC
+    LIMIT $3
+"""
+
+GET_TRENDING_TOPICS_SQL = """
+    SELECT id::text AS id, topic, category, trending_score, mention_count,
+           COALESCE(sentiment_score, 0)::float8 AS sentiment_score,
+           first_detected, last_updated,
+           COALESCE(related_keywords, '{}') AS related_keywords
+    FROM trending_topics
+    WHERE last_updated >= NOW() - make_interval(hours => $1::integer)
+    AND ($2::text IS NULL OR category = $2::text)
+    ORDER BY trending_score DESC
+    LIMIT $3
+"""
+
+@lru_cache(maxsize=8192)
+def _parse_iso_timestamp(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp, accepting a trailing 'Z' for UTC.
+
+    Feed timestamps repeat heavily across refetches, so parses are memoized.
+    """
+    return datetime.fromisoformat(value[:-1] + '+00:00' if value.endswith('Z') else value)
+
+def _is_retryable_metric_error(error: Exception) -> bool:
+    # asyncpg's client-side DataError (a value the column codec rejects) is an
+    # InterfaceError as well as a ValueError; it is bad data, not an outage
+    return isinstance(error, METRIC_RETRYABLE_ERRORS) and not isinstance(error, ValueError)
+
+def _encode_jsonb(value: Any) -> bytes:
+    # Binary jsonb is a version byte followed by the JSON text
+    return b'\x01' + orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+def _decode_jsonb(data: bytes) -> Any:
+    return orjson.loads(data[1:])
+
+async def _init_connection(conn: asyncpg.Connection):
+    """Per-connection setup: exchange jsonb values as Python objects"""
+    await conn.set_type_codec(
+        'jsonb', encoder=_encode_jsonb, decoder=_decode_jsonb,
+        schema='pg_catalog', format='binary'
+    )
+
 class TimescaleDBService:
     """
     TimescaleDB service for news caching and social media content scheduling.
-    Optimized for time-series data with automatic retention policies.
+    Optimized for time-series data with native compression and automatic retention policies.
     """
 
     def __init__(self):
         self.connection_string = os.getenv("TIMESCALE_CONNECTION_STRING")
         self.pool = None
-        self.throttler = Throttler(rate_limit=100)  # 100 queries per second
+        # Fail fast when the pool is exhausted instead of queueing indefinitely
+        self.acquire_timeout = float(os.getenv("DB_ACQUIRE_TIMEOUT", "2.0"))
+        self.pool_acquire_timeouts = 0
+        self.trending_aggregate_enabled = False
+        # Pending metrics keyed by (content_id, metric_name); a newer value for
+        # the same key replaces the one still waiting to be flushed
+        self._metric_queue: Dict[tuple, tuple] = {}
+        self._metric_flush_task: Optional[asyncio.Task] = None
+        self._agent_response_purge_task: Optional[asyncio.Task] = None
 
     async def initialize(self):
         """Initialize the database connection pool and create tables"""
@@ -33,9 +256,11 @@ class TimescaleDBService:
             # Create connection pool
             self.pool = await asyncpg.create_pool(
                 self.connection_string,
-                min_size=5,
-                max_size=20,
-                command_timeout=60
+                min_size=10,
+                max_size=50,
+                max_inactive_connection_lifetime=300,
+                command_timeout=60,
+                init=_init_connection
             )
 
             logger.info("TimescaleDB connection pool created successfully")
@@ -44,19 +269,48 @@ class TimescaleDBService:
             await self._create_tables()
             logger.info("Database schema initialized successfully")
 
+            self._metric_flush_task = asyncio.create_task(self._metric_flush_loop())
+            self._agent_response_purge_task = asyncio.create_task(self._agent_response_purge_loop())
+
         except Exception as e:
             logger.error(f"Failed to initialize TimescaleDB: {e}")
             raise e
 
     async def close(self):
         """Close the database connection pool"""
+        for task in (self._metric_flush_task, self._agent_response_purge_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._metric_flush_task = None
+        self._agent_response_purge_task = None
+
         if self.pool:
+            await self._flush_metrics()
             await self.pool.close()
             logger.info("TimescaleDB connection pool closed")
 
+    @asynccontextmanager
+    async def _connection(self):
+        """Acquire a pooled connection, giving up after acquire_timeout seconds"""
+        try:
+            conn = await self.pool.acquire(timeout=self.acquire_timeout)
+        except asyncio.TimeoutError:
+            self.pool_acquire_timeouts += 1
+            logger.warning(f"Timed out acquiring a database connection "
+                           f"({self.pool_acquire_timeouts} total)")
+            raise
+        try:
+            yield conn
+        finally:
+            await self.pool.release(conn)
+
     async def _create_tables(self):
         """Create TimescaleDB tables with hypertables for time-series data"""
-        async with self.pool.acquire() as conn:
+        async with self._connection() as conn:
             # Enable TimescaleDB extension
             await conn.execute("CREATE EXTENSION IF NOT EXISTS timescaledb CASCADE;")
 
@@ -136,21 +390,26 @@ class TimescaleDBService:
             # Content performance analytics table
             await conn.execute("""
                 CREATE TABLE IF NOT EXISTS content_analytics (
-                    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                    content_id UUID REFERENCES social_content_schedule(id),
+                    id UUID DEFAULT gen_random_uuid(),
+                    content_id UUID, -- social_content_schedule.id; a hypertable can't be referenced by id alone
                     metric_name TEXT NOT NULL, -- views, likes, shares, comments, etc.
                     metric_value NUMERIC NOT NULL,
                     recorded_at TIMESTAMPTZ DEFAULT NOW(),
                     platform TEXT,
-                    additional_data JSONB DEFAULT '{}'
+                    additional_data JSONB DEFAULT '{}',
+                    PRIMARY KEY (id, recorded_at) -- Composite key for hypertable
                 );
             """)
+            await self._migrate_to_composite_key(conn, 'content_analytics', 'recorded_at')
+            await conn.execute("""
+                ALTER TABLE content_analytics DROP CONSTRAINT IF EXISTS content_analytics_content_id_fkey;
+            """)
 
             # Convert to hypertable
             try:
                 await conn.execute("""
                     SELECT create_hypertable('content_analytics', 'recorded_at',
-                                           if_not_exists => TRUE);
+                                           if_not_exists => TRUE, migrate_data => TRUE);
                 """)
             except Exception as e:
                 if "already a hypertable" not in str(e):
@@ -159,7 +418,7 @@ class TimescaleDBService:
             # Trending topics table
             await conn.execute("""
                 CREATE TABLE IF NOT EXISTS trending_topics (
-                    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+                    id UUID DEFAULT gen_random_uuid(),
                     topic TEXT NOT NULL,
                     category TEXT,
                     trending_score INTEGER DEFAULT 0,
@@ -170,336 +429,597 @@ class TimescaleDBService:
                     peak_score INTEGER DEFAULT 0,
                     peak_time TIMESTAMPTZ,
                     related_keywords TEXT[],
-                    source_data JSONB DEFAULT '{}'
+                    source_data JSONB DEFAULT '{}',
+                    PRIMARY KEY (id, last_updated) -- Composite key for hypertable
                 );
             """)
+            await self._migrate_to_composite_key(conn, 'trending_topics', 'last_updated')
 
             # Convert to hypertable
             try:
                 await conn.execute("""
                     SELECT create_hypertable('trending_topics', 'last_updated',
-                                           if_not_exists => TRUE);
+                                           if_not_exists => TRUE, migrate_data => TRUE);
                 """)
             except Exception as e:
                 if "already a hypertable" not in str(e):
                     logger.warning(f"Failed to create hypertable for trending_topics: {e}")
 
+            # Agent response cache keyed by request hash. A plain table rather
+            # than a hypertable so the hash can be a primary key for upserts.
+            await conn.execute("""
+                CREATE TABLE IF NOT EXISTS agent_response_cache (
+                    query_hash TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    created_at TIMESTAMPTZ DEFAULT NOW(),
+                    expires_at TIMESTAMPTZ NOT NULL
+                );
+            """)
+            await conn.execute("CREATE INDEX IF NOT EXISTS idx_agent_response_cache_expires ON agent_response_cache(expires_at);")
+
             # Create indexes for better performance
-            await conn.execute("CREATE INDEX IF NOT EXISTS idx_news_cache_category ON news_cache(category);")
+            # Category listing walks this index in its keyset order, so pages
+            # need no sort; chunk exclusion handles the fetch_timestamp range
+            await conn.execute("DROP INDEX IF EXISTS idx_news_cache_category;")
+            await conn.execute("DROP INDEX IF EXISTS idx_news_cache_cat_ts;")
+            await conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_news_cache_cat_ts_id
+                ON news_cache(category, fetch_timestamp DESC, id DESC);
+            """)
             await conn.execute("CREATE INDEX IF NOT EXISTS idx_news_cache_tags ON news_cache USING GIN(tags);")
             await conn.execute("CREATE INDEX IF NOT EXISTS idx_news_cache_content_hash ON news_cache(content_hash);")
             await conn.execute("CREATE INDEX IF NOT EXISTS idx_social_schedule_platform ON social_content_schedule(platform);")
-            await conn.execute("CREATE INDEX IF NOT EXISTS idx_social_schedule_status ON social_content_schedule(status);")
+            # Partial indexes for the dominant 'scheduled' listing; other statuses
+            # are rare reads and are covered by the (status, created_at) index
+            await conn.execute("DROP INDEX IF EXISTS idx_social_schedule_status;")
+            await conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_social_sched_scheduled
+                ON social_content_schedule(scheduled_time, id) WHERE status = 'scheduled';
+            """)
+            await conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_social_sched_platform_scheduled
+                ON social_content_schedule(platform, scheduled_time, id) WHERE status = 'scheduled';
+            """)
+            await conn.execute("CREATE INDEX IF NOT EXISTS idx_social_schedule_status_created ON social_content_schedule(status, created_at);")
             await conn.execute("CREATE INDEX IF NOT EXISTS idx_trending_topic ON trending_topics(topic);")
+            await conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_content_analytics_metric
+                ON content_analytics(content_id, metric_name, recorded_at DESC);
+            """)
+
+            # Smaller news_cache chunks so expired articles can be dropped a chunk at a time
+            try:
+                await conn.execute("SELECT set_chunk_time_interval('news_cache', INTERVAL '6 hours');")
+            except Exception as e:
+                logger.warning(f"Failed to set chunk interval for news_cache: {e}")
+
+            # Native compression: (hypertable, segment by, order by, compress chunks older than)
+            compression_settings = [
+                ('news_cache', 'category', 'fetch_timestamp DESC', '2 days'),  # > NEWS_DEDUP_WINDOW
+                ('social_content_schedule', 'platform, status', 'scheduled_time DESC', '30 days'),
+                ('content_analytics', 'platform, metric_name', 'recorded_at DESC', '7 days'),
+                ('trending_topics', 'category', 'last_updated DESC', '7 days'),
+            ]
+            for table, segment_by, order_by, compress_after in compression_settings:
+                try:
+                    compression_enabled = await conn.fetchval("""
+                        SELECT compression_enabled FROM timescaledb_information.hypertables
+                        WHERE hypertable_name = $1
+                    """, table)
+                    if compression_enabled is None:
+                        logger.warning(f"Skipping compression for {table}: not a hypertable")
+                        continue
+
+                    # Compression settings cannot be changed once chunks are compressed
+                    if not compression_enabled:
+                        await conn.execute(f"""
+                            ALTER TABLE {table} SET (
+                                timescaledb.compress,
+                                timescaledb.compress_segmentby = '{segment_by}',
+                                timescaledb.compress_orderby = '{order_by}'
+                            );
+                        """)
+                    await conn.execute(f"""
+                        SELECT add_compression_policy('{table}', INTERVAL '{compress_after}',
+                                                      if_not_exists => TRUE);
+                    """)
+                except Exception as e:
+                    logger.warning(f"Failed to enable compression for {table}: {e}")
+
+            # Retention matches the 7-day expiry_date default on cached articles
+            try:
+                await conn.execute("""
+                    SELECT add_retention_policy('news_cache', INTERVAL '7 days',
+                                                if_not_exists => TRUE);
+                """)
+            except Exception as e:
+                logger.warning(f"Failed to add retention policy for news_cache: {e}")
+
+            # Hourly rollup of trending topics, refreshed in the background.
+            # Real-time aggregation fills in the not-yet-materialized last hour.
+            try:
+                await conn.execute("""
+                    CREATE MATERIALIZED VIEW IF NOT EXISTS trending_topics_hourly
+                    WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+                    SELECT time_bucket('1 hour', last_updated) AS bucket,
+                           category,
+                           topic,
+                           MAX(trending_score) AS peak_score,
+                           SUM(mention_count) AS mentions,
+                           AVG(sentiment_score) AS avg_sentiment,
+                           MIN(first_detected) AS first_detected,
+                           MAX(last_updated) AS last_seen
+                    FROM trending_topics
+                    GROUP BY bucket, category, topic
+                    WITH NO DATA;
+                """)
+                await conn.execute("""
+                    SELECT add_continuous_aggregate_policy('trending_topics_hourly',
+                        start_offset => INTERVAL '7 days',
+                        end_offset => INTERVAL '1 hour',
+                        schedule_interval => INTERVAL '15 minutes',
+                        if_not_exists => TRUE);
+                """)
+                self.trending_aggregate_enabled = True
+            except Exception as e:
+                logger.warning(f"Failed to create trending_topics_hourly aggregate: {e}")
 
-            # Skip retention policies for now to get basic functionality working
-            # These can be added later once hypertables are properly configured
             logger.info("Database schema setup completed")
 
+    async def _migrate_to_composite_key(self, conn: asyncpg.Connection, table: str, time_column: str):
+        """Widen an `id`-only primary key created by earlier versions to (id, time_column).
+
+        A hypertable's unique indexes must include its partitioning column, so
+        create_hypertable fails on such tables. Hypertables are left untouched.
+        """
+        try:
+            is_hypertable = await conn.fetchval("""
+                SELECT EXISTS (SELECT 1 FROM timescaledb_information.hypertables
+                               WHERE hypertable_name = $1)
+            """, table)
+            if is_hypertable:
+                return
+
+            key_columns = await conn.fetchval("""
+                SELECT array_agg(a.attname::text ORDER BY a.attname)
+                FROM pg_index i
+                JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
+                WHERE i.indrelid = $1::regclass AND i.indisprimary
+            """, table)
+            if key_columns == ['id']:
+                await conn.execute(f"""
+                    ALTER TABLE {table} DROP CONSTRAINT {table}_pkey,
+                                        ADD PRIMARY KEY (id, {time_column});
+                """)
+                logger.info(f"Migrated {table} primary key to (id, {time_column})")
+        except Exception as e:
+            logger.warning(f"Failed to migrate primary key for {table}: {e}")
+
     # News caching methods
-    async def cache_news_article(self, article_data: Dict[str, Any]) -> str:
-        """Cache a news article in TimescaleDB"""
-        async with self.throttler:
+    def _content_hash(self, article_data: Dict[str, Any]) -> str:
+        """Deduplication key for a news article, stable across processes and restarts"""
+        key = f"{article_data.get('title', '')}\x00{article_data.get('url', '')}"
+        return hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+
+    def _news_row(self, article_data: Dict[str, Any], content_hash: str,
+                  now: Optional[datetime] = None) -> tuple:
+        """Column values for a news_cache row, in NEWS_CACHE_COLUMNS order"""
+        published_at = article_data.get('publishedAt')
+        if isinstance(published_at, str):
             try:
-                async with self.pool.acquire() as conn:
-                    # Generate content hash for deduplication
-                    content_hash = str(hash(f"{article_data.get('title', '')}{article_data.get('url', '')}"))
-
-                    # Check if article already exists
-                    existing = await conn.fetchrow(
-                        "SELECT id FROM news_cache WHERE content_hash = $1",
-                        content_hash
-                    )
+                published_at = _parse_iso_timestamp(published_at) if published_at else None
+            except ValueError:
+                # Agent output carries free-form dates ("Oct 15, 2026"); treat
+                # them as unknown rather than failing the whole write
+                published_at = None
 
-                    if existing:
-                        # Update existing article
-                        await conn.execute("""
-                            UPDATE news_cache SET
-                                last_updated = NOW(),
-                                social_engagement = $1,
-                                trending_potential = $2
-                            WHERE content_hash = $3
-                        """,
-                        json.dumps(article_data.get('social_engagement', {})),
-                        article_data.get('trending_potential', 50),
-                        content_hash
-                        )
-                        return str(existing['id'])
-                    else:
-                        # Insert new article
-                        article_id = await conn.fetchval("""
-                            INSERT INTO news_cache (
-                                article_id, title, summary, url, source, published_at,
-                                category, sentiment, trending_potential, tags,
-                                social_engagement, content_hash, agent_source, raw_data
-                            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14)
-                            RETURNING id
-                        """,
-                        article_data.get('id', str(uuid.uuid4())),
-                        article_data.get('title'),
-                        article_data.get('summary'),
-                        article_data.get('url'),
-                        article_data.get('source'),
-                        datetime.fromisoformat(article_data.get('publishedAt').replace('Z', '+00:00')) if article_data.get('publishedAt') else datetime.now(),
-                        article_data.get('category'),
-                        article_data.get('sentiment', 'neutral'),
-                        article_data.get('trending_potential', 50),
-                        article_data.get('tags', []),
-                        json.dumps(article_data.get('social_engagement', {})),
-                        content_hash,
-                        article_data.get('agent_source', 'brightdata'),
-                        json.dumps(article_data)
+        return (
+            article_data.get('id', str(uuid.uuid4())),
+            article_data.get('title'),
+            article_data.get('summary'),
+            article_data.get('url'),
+            article_data.get('source'),
+            published_at or now or datetime.now(timezone.utc),
+            article_data.get('category'),
+            article_data.get('sentiment', 'neutral'),
+            article_data.get('trending_potential', 50),
+            article_data.get('tags', []),
+            article_data.get('social_engagement', {}),
+            content_hash,
+            article_data.get('agent_source', 'brightdata'),
+            article_data
+        )
+
+    async def cache_news_article(self, article_data: Dict[str, Any]) -> str:
+        """Cache a news article in TimescaleDB.
+
+        Use cache_news_articles_bulk for more than ~10 articles.
+        """
+        try:
+            async with self._connection() as conn:
+                # Generate content hash for deduplication
+                content_hash = self._content_hash(article_data)
+
+                # Refresh the cached copy if there is one, otherwise insert, in a
+                # single round-trip. news_cache is a hypertable, so there is no
+                # unique index on content_hash for ON CONFLICT to target.
+                article_id = await conn.fetchval(
+                    CACHE_NEWS_ARTICLE_SQL, *self._news_row(article_data, content_hash)
+                )
+                return str(article_id)
+
+        except Exception as e:
+            logger.error(f"Failed to cache news article: {e}")
+            raise e
+
+    async def cache_news_articles_bulk(self, articles: List[Dict[str, Any]]) -> List[str]:
+        """Cache a batch of news articles in one transaction.
+
+        Articles cached within NEWS_DEDUP_WINDOW (same content hash) get their
+        engagement data refreshed; new ones are streamed in with a single COPY.
+        Articles without a title are skipped, since news_cache.title is NOT NULL
+        and one such row would fail the whole COPY. Returns the news_cache ids
+        of the cached articles, in input order.
+        """
+        titled = [article for article in articles if article.get('title')]
+        if len(titled) < len(articles):
+            logger.warning(f"Skipping {len(articles) - len(titled)} news articles without a title")
+        articles = titled
+        if not articles:
+            return []
+
+        # Deduplicate within the batch; the last copy of an article wins
+        hashes = [self._content_hash(article) for article in articles]
+        by_hash = dict(zip(hashes, articles))
+
+        try:
+            async with self._connection() as conn:
+                async with conn.transaction():
+                    existing = await conn.fetch(FIND_CACHED_NEWS_HASHES_SQL, list(by_hash))
+                    ids = {row['content_hash']: row['id'] for row in existing}
+
+                    if ids:
+                        await conn.executemany(REFRESH_CACHED_NEWS_SQL, [
+                            (
+                                by_hash[content_hash].get('social_engagement', {}),
+                                by_hash[content_hash].get('trending_potential', 50),
+                                content_hash
+                            )
+                            for content_hash in ids
+                        ])
+
+                    # Generate ids client-side so COPY needs no RETURNING
+                    now = datetime.now(timezone.utc)
+                    records = []
+                    for content_hash, article_data in by_hash.items():
+                        if content_hash not in ids:
+                            ids[content_hash] = uuid.uuid4()
+                            records.append((ids[content_hash], *self._news_row(article_data, content_hash, now)))
+
+                    if records:
+                        await conn.copy_records_to_table(
+                            'news_cache', records=records, columns=('id',) + NEWS_CACHE_COLUMNS
                         )
-                        return str(article_id)
 
-            except Exception as e:
-                logger.error(f"Failed to cache news article: {e}")
-                raise e
+            return [str(ids[content_hash]) for content_hash in hashes]
+
+        except Exception as e:
+            logger.error(f"Failed to bulk cache news articles: {e}")
+            raise e
 
     async def get_cached_news(self, category: Optional[str] = None, limit: int = 10,
-                            hours_back: int = 24) -> List[Dict[str, Any]]:
-        """Retrieve cached news articles"""
-        async with self.throttler:
-            try:
-                async with self.pool.acquire() as conn:
-                    query = """
-                        SELECT * FROM news_cache
-                        WHERE fetch_timestamp >= NOW() - INTERVAL '%d hours'
-                        AND (expiry_date IS NULL OR expiry_date > NOW())
-                    """ % hours_back
-
-                    params = []
-                    param_count = 1
-
-                    if category:
-                        query += f" AND category = ${param_count}"
-                        params.append(category)
-                        param_count += 1
-
-                    query += f" ORDER BY fetch_timestamp DESC LIMIT ${param_count}"
-                    params.append(limit)
-
-                    rows = await conn.fetch(query, *params)
-
-                    articles = []
-                    for row in rows:
-                        article = {
-                            'id': str(row['article_id']),
-                            'title': row['title'],
-                            'summary': row['summary'],
-                            'url': row['url'],
-                            'source': row['source'],
-                            'publishedAt': row['published_at'].isoformat() if row['published_at'] else None,
-                            'category': row['category'],
-                            'sentiment': row['sentiment'],
-                            'trending_potential': row['trending_potential'],
-                            'tags': row['tags'] or [],
-                            'social_engagement': json.loads(row['social_engagement']) if row['social_engagement'] else {},
-                            'cached_at': row['fetch_timestamp'].isoformat(),
-                            'agent_source': row['agent_source']
-                        }
-                        articles.append(article)
-
-                    return articles
+                            hours_back: int = 24, before: Union[datetime, str, None] = None,
+                            before_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Retrieve cached news articles, newest first.
 
-            except Exception as e:
-                logger.error(f"Failed to get cached news: {e}")
-                return []
+        To fetch the next page, pass the last article's cached_at (as returned,
+        an ISO string) as `before` and its cache_id as `before_id` (articles
+        cached in one batch share a fetch_timestamp, so the id breaks ties).
+        """
+        try:
+            if isinstance(before, str):
+                before = _parse_iso_timestamp(before)
+            async with self._connection() as conn:
+                rows = await conn.fetch(GET_CACHED_NEWS_SQL, hours_back, category, limit,
+                                        before, before_id)
+
+                articles = [dict(row) for row in rows]
+                for article in articles:
+                    if article['publishedAt']:
+                        article['publishedAt'] = article['publishedAt'].isoformat()
+                    article['cached_at'] = article['cached_at'].isoformat()
+
+                return articles
+
+        except Exception as e:
+            logger.error(f"Failed to get cached news: {e}")
+            return []
+
+    # Agent response caching methods
+    async def get_cached_agent_response(self, query_hash: str) -> Optional[tuple]:
+        """Return (response, seconds until it expires) for an unexpired cached response"""
+        try:
+            async with self._connection() as conn:
+                row = await conn.fetchrow(GET_AGENT_RESPONSE_SQL, query_hash)
+                return (row['response'], row['ttl_remaining']) if row else None
+
+        except Exception as e:
+            logger.error(f"Failed to get cached agent response: {e}")
+            return None
+
+    async def cache_agent_response(self, query_hash: str, response: str, ttl_seconds: int) -> bool:
+        """Store an agent response for ttl_seconds"""
+        try:
+            async with self._connection() as conn:
+                await conn.execute(CACHE_AGENT_RESPONSE_SQL, query_hash, response, ttl_seconds)
+                return True
+
+        except Exception as e:
+            logger.error(f"Failed to cache agent response: {e}")
+            return False
+
+    async def purge_expired_agent_responses(self) -> int:
+        """Delete expired agent responses, returning how many were removed"""
+        try:
+            async with self._connection() as conn:
+                status = await conn.execute(PURGE_AGENT_RESPONSES_SQL)
+                return int(status.split()[-1])
+
+        except Exception as e:
+            logger.error(f"Failed to purge expired agent responses: {e}")
+            return 0
+
+    async def _agent_response_purge_loop(self):
+        """Background task that periodically purges expired agent responses"""
+        while True:
+            await asyncio.sleep(AGENT_RESPONSE_PURGE_INTERVAL)
+            await self.purge_expired_agent_responses()
 
     # Social media scheduling methods
     async def schedule_social_content(self, content_data: Dict[str, Any]) -> str:
         """Schedule social media content"""
-        async with self.throttler:
-            try:
-                async with self.pool.acquire() as conn:
-                    content_id = await conn.fetchval("""
-                        INSERT INTO social_content_schedule (
-                            content_id, platform, content_type, title, content_text,
-                            media_urls, hashtags, scheduled_time, campaign_id,
-                            target_audience, ai_generated, source_news_id
-                        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)
-                        RETURNING id
-                    """,
-                    content_data.get('content_id', str(uuid.uuid4())),
-                    content_data.get('platform'),
-                    content_data.get('content_type', 'post'),
-                    content_data.get('title'),
-                    content_data.get('content_text'),
-                    content_data.get('media_urls', []),
-                    content_data.get('hashtags', []),
-                    datetime.fromisoformat(content_data['scheduled_time'].replace('Z', '+00:00')) if isinstance(content_data['scheduled_time'], str) else content_data['scheduled_time'],
-                    content_data.get('campaign_id'),
-                    json.dumps(content_data.get('target_audience', {})),
-                    content_data.get('ai_generated', False),
-                    content_data.get('source_news_id')
-                    )
-                    return str(content_id)
+        try:
+            async with self._connection() as conn:
+                content_id = await conn.fetchval(SCHEDULE_SOCIAL_CONTENT_SQL,
+                content_data.get('content_id', str(uuid.uuid4())),
+                content_data.get('platform'),
+                content_data.get('content_type', 'post'),
+                content_data.get('title'),
+                content_data.get('content_text'),
+                content_data.get('media_urls', []),
+                content_data.get('hashtags', []),
+                _parse_iso_timestamp(content_data['scheduled_time']) if isinstance(content_data['scheduled_time'], str) else content_data['scheduled_time'],
+                content_data.get('campaign_id'),
+                content_data.get('target_audience', {}),
+                content_data.get('ai_generated', False),
+                content_data.get('source_news_id')
+                )
+                return str(content_id)
 
-            except Exception as e:
-                logger.error(f"Failed to schedule social content: {e}")
-                raise e
+        except Exception as e:
+            logger.error(f"Failed to schedule social content: {e}")
+            raise e
 
     async def get_scheduled_content(self, platform: Optional[str] = None,
-                                  status: str = 'scheduled', limit: int = 20) -> List[Dict[str, Any]]:
-        """Get scheduled social media content"""
-        async with self.throttler:
-            try:
-                async with self.pool.acquire() as conn:
-                    query = """
-                        SELECT sc.*, nc.title as news_title, nc.url as news_url
-                        FROM social_content_schedule sc
-                        LEFT JOIN news_cache nc ON sc.source_news_id = nc.id
-                        WHERE sc.status = $1
-                    """
-                    params = [status]
-                    param_count = 2
-
-                    if platform:
-                        query += f" AND sc.platform = ${param_count}"
-                        params.append(platform)
-                        param_count += 1
-
-                    query += f" ORDER BY sc.scheduled_time ASC LIMIT ${param_count}"
-                    params.append(limit)
-
-                    rows = await conn.fetch(query, *params)
-
-                    content_list = []
-                    for row in rows:
-                        content = {
-                            'id': str(row['id']),
-                            'content_id': row['content_id'],
-                            'platform': row['platform'],
-                            'content_type': row['content_type'],
-                            'title': row['title'],
-                            'content_text': row['content_text'],
-                            'media_urls': row['media_urls'] or [],
-                            'hashtags': row['hashtags'] or [],
-                            'scheduled_time': row['scheduled_time'].isoformat(),
-                            'status': row['status'],
-                            'campaign_id': row['campaign_id'],
-                            'ai_generated': row['ai_generated'],
-                            'source_news': {
-                                'title': row['news_title'],
-                                'url': row['news_url']
-                            } if row['news_title'] else None
-                        }
-                        content_list.append(content)
-
-                    return content_list
+                                  status: str = 'scheduled', limit: int = 20,
+                                  after: Union[datetime, str, None] = None,
+                                  after_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get scheduled social media content, soonest first.
 
-            except Exception as e:
-                logger.error(f"Failed to get scheduled content: {e}")
-                return []
+        To fetch the next page, pass the last item's scheduled_time (as
+        returned, an ISO string) as `after` and its id as `after_id`.
+        """
+        try:
+            if isinstance(after, str):
+                after = _parse_iso_timestamp(after)
+            async with self._connection() as conn:
+                rows = await conn.fetch(GET_SCHEDULED_CONTENT_SQL, status, platform, limit,
+                                        after, after_id)
+
+                # Look up source articles separately: joining news_cache on
+                # source_news_id gives no time predicate for chunk exclusion
+                news_ids = list({row['source_news_id'] for row in rows if row['source_news_id']})
+                news_by_id = {}
+                if news_ids:
+                    news_by_id = {
+                        news['id']: news
+                        for news in await conn.fetch(GET_SOURCE_NEWS_SQL, news_ids)
+                    }
+
+                content_list = [dict(row) for row in rows]
+                for content in content_list:
+                    content['scheduled_time'] = content['scheduled_time'].isoformat()
+                    news = news_by_id.get(content.pop('source_news_id'))
+                    content['source_news'] = {
+                        'title': news['title'],
+                        'url': news['url']
+                    } if news and news['title'] else None
+
+                return content_list
+
+        except Exception as e:
+            logger.error(f"Failed to get scheduled content: {e}")
+            return []
 
     async def update_content_status(self, content_id: str, status: str,
                                   engagement_data: Optional[Dict] = None) -> bool:
         """Update social content status and engagement data"""
-        async with self.throttler:
-            try:
-                async with self.pool.acquire() as conn:
-                    if status == 'posted':
-                        await conn.execute("""
-                            UPDATE social_content_schedule SET
-                                status = $1, posted_at = NOW(), engagement_data = $2
-                            WHERE id = $3
-                        """, status, json.dumps(engagement_data or {}), content_id)
-                    else:
-                        await conn.execute("""
-                            UPDATE social_content_schedule SET status = $1
-                            WHERE id = $2
-                        """, status, content_id)
-
-                    return True
+        try:
+            async with self._connection() as conn:
+                if status == 'posted':
+                    await conn.execute(MARK_CONTENT_POSTED_SQL, status,
+                                   engagement_data or {}, content_id)
+                else:
+                    await conn.execute(UPDATE_CONTENT_STATUS_SQL, status, content_id)
 
-            except Exception as e:
-                logger.error(f"Failed to update content status: {e}")
-                return False
+                return True
+
+        except Exception as e:
+            logger.error(f"Failed to update content status: {e}")
+            return False
 
     # Analytics and trending methods
     async def record_content_metric(self, content_id: str, metric_name: str,
                                   metric_value: float, platform: str) -> bool:
-        """Record a content performance metric"""
-        async with self.throttler:
-            try:
-                async with self.pool.acquire() as conn:
-                    await conn.execute("""
-                        INSERT INTO content_analytics (content_id, metric_name, metric_value, platform)
-                        VALUES ($1, $2, $3, $4)
-                    """, content_id, metric_name, metric_value, platform)
-                    return True
+        """Queue a content performance metric for the next batched write.
+
+        Metrics are flushed with COPY every METRIC_FLUSH_INTERVAL seconds. If the
+        same metric is recorded again before then, only the latest value is kept.
+        Use bulk_record_metrics to write more than ~10 metrics immediately.
+        """
+        try:
+            if len(self._metric_queue) >= METRIC_QUEUE_LIMIT:
+                # Apply back-pressure instead of letting the buffer grow unbounded
+                await self._flush_metrics()
+                if len(self._metric_queue) >= METRIC_QUEUE_LIMIT:
+                    raise RuntimeError("metric queue is full")
+
+            self._metric_queue[(content_id, metric_name)] = (
+                metric_value, platform, datetime.now(timezone.utc)
+            )
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to record content metric: {e}")
+            return False
+
+    async def bulk_record_metrics(self, metrics: List[tuple]) -> int:
+        """Write (content_id, metric_name, metric_value, platform) tuples now.
+
+        All rows go over one pooled connection in a single transaction.
+        """
+        if not metrics:
+            return 0
+
+        try:
+            async with self._connection() as conn:
+                async with conn.transaction():
+                    await conn.executemany(INSERT_CONTENT_METRIC_SQL, metrics)
+            return len(metrics)
+
+        except Exception as e:
+            logger.error(f"Failed to bulk record {len(metrics)} content metrics: {e}")
+            return 0
+
+    async def _flush_metrics(self):
+        """Write all pending metrics to content_analytics in one COPY.
+
+        If the database is unreachable the batch is requeued. If the COPY is
+        rejected, the rows are inserted one at a time and any row that still
+        fails is logged and dropped, so one bad metric cannot block the queue.
+        """
+        if not self._metric_queue:
+            return
+
+        batch, self._metric_queue = self._metric_queue, {}
+        records = [
+            (content_id, metric_name, value, platform, recorded_at)
+            for (content_id, metric_name), (value, platform, recorded_at) in batch.items()
+        ]
+
+        try:
+            async with self._connection() as conn:
+                try:
+                    await conn.copy_records_to_table(
+                        'content_analytics', records=records, columns=CONTENT_METRIC_COLUMNS
+                    )
+                    return
+                except Exception as e:
+                    if _is_retryable_metric_error(e):
+                        raise
+                    logger.warning(f"Failed to copy {len(records)} content metrics, "
+                                   f"inserting them one at a time: {e}")
+
+                await self._insert_metrics_individually(conn, records)
 
+        except Exception as e:
+            if not _is_retryable_metric_error(e):
+                logger.error(f"Dropped {len(records)} content metrics: {e}")
+                return
+            logger.error(f"Failed to flush {len(records)} content metrics: {e}")
+            self._requeue_metrics(records)
+
+    async def _insert_metrics_individually(self, conn: asyncpg.Connection, records: List[tuple]):
+        """Insert metric records one by one, dropping rows the database rejects"""
+        dropped = 0
+        first_error = None
+        for index, record in enumerate(records):
+            try:
+                await conn.execute(INSERT_QUEUED_METRIC_SQL, *record)
             except Exception as e:
-                logger.error(f"Failed to record content metric: {e}")
-                return False
+                if _is_retryable_metric_error(e):
+                    logger.error(f"Failed to flush {len(records) - index} content metrics: {e}")
+                    self._requeue_metrics(records[index:])
+                    break
+                dropped += 1
+                first_error = first_error or e
+                logger.debug(f"Dropping content metric {record[:2]}: {e}")
+
+        if dropped:
+            logger.error(f"Dropped {dropped} of {len(records)} content metrics that could "
+                         f"not be written: {first_error}")
+
+    def _requeue_metrics(self, records: List[tuple]):
+        """Put unwritten metric records back, without clobbering values recorded since"""
+        for content_id, metric_name, value, platform, recorded_at in records:
+            self._metric_queue.setdefault((content_id, metric_name), (value, platform, recorded_at))
+
+    async def _metric_flush_loop(self):
+        """Background task that periodically flushes queued metrics"""
+        while True:
+            await asyncio.sleep(METRIC_FLUSH_INTERVAL)
+            await self._flush_metrics()
 
     async def get_trending_topics(self, category: Optional[str] = None,
                                 limit: int = 20, hours_back: int = 24) -> List[Dict[str, Any]]:
-        """Get trending topics from the database"""
-        async with self.throttler:
-            try:
-                async with self.pool.acquire() as conn:
-                    query = """
-                        SELECT * FROM trending_topics
-                        WHERE last_updated >= NOW() - INTERVAL '%d hours'
-                    """ % hours_back
-
-                    params = []
-                    param_count = 1
-
-                    if category:
-                        query += f" AND category = ${param_count}"
-                        params.append(category)
-                        param_count += 1
-
-                    query += f" ORDER BY trending_score DESC LIMIT ${param_count}"
-                    params.append(limit)
-
-                    rows = await conn.fetch(query, *params)
-
-                    topics = []
-                    for row in rows:
-                        topic = {
-                            'id': str(row['id']),
-                            'topic': row['topic'],
-                            'category': row['category'],
-                            'trending_score': row['trending_score'],
-                            'mention_count': row['mention_count'],
-                            'sentiment_score': float(row['sentiment_score']) if row['sentiment_score'] else 0.0,
-                            'first_detected': row['first_detected'].isoformat(),
-                            'last_updated': row['last_updated'].isoformat(),
-                            'related_keywords': row['related_keywords'] or []
-                        }
-                        topics.append(topic)
-
-                    return topics
+        """Get trending topics from the database.
 
-            except Exception as e:
-                logger.error(f"Failed to get trending topics: {e}")
-                return []
+        Windows of an hour or more are answered from the trending_topics_hourly
+        continuous aggregate, one row per topic; those rows carry no id or
+        related keywords.
+        """
+        try:
+            async with self._connection() as conn:
+                if self.trending_aggregate_enabled and hours_back >= 1:
+                    rows = await conn.fetch(GET_TRENDING_TOPICS_HOURLY_SQL, hours_back, category, limit)
+                else:
+                    rows = await conn.fetch(GET_TRENDING_TOPICS_SQL, hours_back, category, limit)
+
+                topics = [dict(row) for row in rows]
+                for topic in topics:
+                    topic['first_detected'] = topic['first_detected'].isoformat()
+                    topic['last_updated'] = topic['last_updated'].isoformat()
+
+                return topics
+
+        except Exception as e:
+            logger.error(f"Failed to get trending topics: {e}")
+            return []
 
     async def cleanup_expired_data(self):
         """Clean up expired cached data"""
-        async with self.throttler:
-            try:
-                async with self.pool.acquire() as conn:
-                    # Clean expired news cache
-                    deleted_news = await conn.execute("""
-                        DELETE FROM news_cache
-                        WHERE expiry_date < NOW()
-                    """)
+        try:
+            async with self._connection() as conn:
+                # Drop whole news_cache chunks past the 7-day expiry horizon
+                # rather than deleting expired rows one by one
+                dropped_chunks = await conn.fetch("""
+                    SELECT drop_chunks('news_cache', older_than => INTERVAL '7 days')
+                """)
 
-                    # Clean old failed/cancelled social content
-                    deleted_social = await conn.execute("""
-                        DELETE FROM social_content_schedule
-                        WHERE status IN ('failed', 'cancelled')
-                        AND created_at < NOW() - INTERVAL '30 days'
-                    """)
+                # Clean old failed/cancelled social content
+                deleted_social = await conn.execute("""
+                    DELETE FROM social_content_schedule
+                    WHERE status IN ('failed', 'cancelled')
+                    AND created_at < NOW() - INTERVAL '30 days'
+                """)
 
-                    logger.info(f"Cleaned up expired data: {deleted_news} news articles, {deleted_social} social content")
+                deleted_responses = await conn.execute(PURGE_AGENT_RESPONSES_SQL)
 
-            except Exception as e:
-                logger.error(f"Failed to cleanup expired data: {e}")
+                logger.info(f"Cleaned up expired data: {len(dropped_chunks)} news chunks, {deleted_social} social content, "
+                            f"{deleted_responses} agent responses")
+
+        except Exception as e:
+            logger.error(f"Failed to cleanup expired data: {e}")
 
 # Global instance
 db_service = TimescaleDBService()
\ No newline at end of file
@@ -1,12 +1,18 @@
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Query
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Query, Request, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 import asyncio
-import json
+import hashlib
 import os
+import re
+import sys
+import time
 import uuid
-from typing import Optional, List
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Optional, List, Dict
 from datetime import datetime, timedelta
 from deepagents import create_deep_agent
 from langchain.chat_models import init_chat_model
@@ -15,13 +21,43 @@ from dotenv import load_dotenv
 import logging
 import random
 import aiohttp
+import orjson
 from database_service import db_service
 from video_combination_service import video_combination_service
 from routes.s3_routes import router as s3_router
 
 load_dotenv()
 
-app = FastAPI(title="Event Hunter API", description="AI-powered event discovery service")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize the agent, database and shared HTTP client; release them on shutdown"""
+    if sys.version_info >= (3, 12):
+        # Tasks that finish without blocking (cache hits, short DB calls)
+        # complete inline instead of waiting for a scheduler pass
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+    # One keep-alive client for all outbound HTTP, see get_http
+    app.state.http = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=200, ttl_dns_cache=300),
+        timeout=aiohttp.ClientTimeout(total=30)
+    )
+    await initialize_agent()
+    await db_service.initialize()
+
+    try:
+        yield
+    finally:
+        # Let fire-and-forget writes finish before the pool goes away
+        if background_tasks:
+            await asyncio.gather(*background_tasks, return_exceptions=True)
+        await app.state.http.close()
+        await db_service.close()
+
+app = FastAPI(
+    title="Event Hunter API",
+    description="AI-powered event discovery service",
+    lifespan=lifespan
+)
 
 # Include S3 proxy routes
 app.include_router(s3_router)
@@ -37,6 +73,51 @@ app.add_middleware(
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Process-local generator for mock and placeholder data
+rng = random.Random()
+
+# Patterns compiled once and shared by the agent response parsers
+JSON_TOKEN_PATTERN = re.compile(r'[\[\]"\\]')
+AMAZON_SIZE_PATTERN = re.compile(r'\._AC_[^.]*\.')
+HASHTAG_STRIP_PATTERN = re.compile(r'\W+')
+
+# Agent prompts for the news endpoints, filled per request by the helpers below
+LATEST_NEWS_PROMPT = (
+    "Search for the latest {category} news articles. Use the search_engine tool to find recent news "
+    "articles from reliable sources. Return exactly {limit} real articles with actual titles, URLs, "
+    "sources, and summaries. Format the response as a JSON array with fields: title, url, source, "
+    "summary, publishedAt, category."
+)
+SEARCH_NEWS_PROMPT = (
+    "Search for news articles about: {query}{category_clause}. Use the search_engine tool to find "
+    "exactly {limit} real articles. Return structured JSON data with fields: title, url, source, "
+    "summary, publishedAt, category."
+)
+
+@lru_cache(maxsize=64)
+def latest_news_prompt(category: Optional[str], limit: int) -> str:
+    return LATEST_NEWS_PROMPT.format_map({"category": category or "technology", "limit": limit})
+
+@lru_cache(maxsize=64)
+def search_news_prompt(query: str, category: Optional[str], limit: int) -> str:
+    return SEARCH_NEWS_PROMPT.format_map({
+        "query": query,
+        "category_clause": f" in the {category} category" if category else "",
+        "limit": limit
+    })
+
+# Social post templates for generate-from-news, filled from per-article fragments
+TWITTER_POST_TEMPLATE = "🚀 {title_100}... \n\n{summary_120}... \n\n#AI #News #Tech"
+LINKEDIN_POST_TEMPLATE = "📰 Industry Update: {title}\n\n{summary}\n\nThoughts? 💭\n\n#Industry #Business #Innovation"
+INSTAGRAM_POST_TEMPLATE = "📊 {title}\n.\n.\n.\n#news #trending #industry #{category_tag}"
+
+# Platform -> (post template, max length); unknown platforms fall back to Instagram
+SOCIAL_POST_FORMATS = {
+    'twitter': (TWITTER_POST_TEMPLATE, 280),
+    'linkedin': (LINKEDIN_POST_TEMPLATE, 3000),
+    'instagram': (INSTAGRAM_POST_TEMPLATE, 2200)
+}
+
 class QueryRequest(BaseModel):
     query: str
 
@@ -89,33 +170,141 @@ def generate_mock_news_data(category: Optional[str] = None, limit: int = 50) ->
     categories = ['technology', 'ai', 'business', 'design', 'marketing', 'photography']
     sources = ['TechCrunch', 'Wired', 'The Verge', 'Ars Technica', 'Fast Company', 'Medium']
 
+    # Text that only depends on the category is built once per category
+    fragments = {}
+    now = datetime.now()
+
+    # Draw every random field for the whole batch up front
+    choices = rng.choices
+    draws = zip(
+        [category] * limit if category else choices(categories, k=limit),
+        choices(sources, k=limit),
+        choices(range(1, 73), k=limit),
+        choices(["positive", "neutral", "negative"], k=limit),
+        choices(range(30, 91), k=limit),
+        choices(range(10, 1001), k=limit),
+        choices(range(5, 201), k=limit),
+        choices(range(2, 101), k=limit)
+    )
+
     mock_news = []
-    for i in range(limit):
-        selected_category = category if category else random.choice(categories)
+    for i, (selected_category, source, hours_ago, sentiment, trending_potential,
+            likes, shares, comments) in enumerate(draws):
+        if selected_category not in fragments:
+            fragments[selected_category] = (
+                f"Latest {selected_category.title()} News Update #",
+                f"This is a comprehensive summary of the latest developments in {selected_category}. The article covers recent trends, innovations, and insights from industry experts.",
+                f"https://example.com/news/{selected_category}/",
+                f"{selected_category}-trends"
+            )
+        title_prefix, summary, url_prefix, trend_tag = fragments[selected_category]
         news_item = {
             "id": str(uuid.uuid4()),
-            "title": f"Latest {selected_category.title()} News Update #{i+1}",
-            "summary": f"This is a comprehensive summary of the latest developments in {selected_category}. The article covers recent trends, innovations, and insights from industry experts.",
-            "url": f"https://example.com/news/{selected_category}/{uuid.uuid4()}",
-            "source": random.choice(sources),
-            "publishedAt": (datetime.now() - timedelta(hours=random.randint(1, 72))).isoformat(),
+            "title": f"{title_prefix}{i+1}",
+            "summary": summary,
+            "url": f"{url_prefix}{uuid.uuid4()}",
+            "source": source,
+            "publishedAt": (now - timedelta(hours=hours_ago)).isoformat(),
             "category": selected_category,
-            "sentiment": random.choice(["positive", "neutral", "negative"]),
-            "trending_potential": random.randint(30, 90),
-            "tags": [selected_category, f"{selected_category}-trends", "innovation", "news"],
+            "sentiment": sentiment,
+            "trending_potential": trending_potential,
+            "tags": [selected_category, trend_tag, "innovation", "news"],
             "social_engagement": {
-                "likes": random.randint(10, 1000),
-                "shares": random.randint(5, 200),
-                "comments": random.randint(2, 100)
+                "likes": likes,
+                "shares": shares,
+                "comments": comments
             }
         }
         mock_news.append(news_item)
 
     return mock_news
 
+def load_object_array(candidate: str) -> Optional[list]:
+    """Parse a bracketed slice of agent output if it is a JSON array of objects"""
+    try:
+        parsed = orjson.loads(candidate)
+    except orjson.JSONDecodeError:
+        return None
+    if not parsed or isinstance(parsed[0], dict):
+        return parsed
+    return None
+
+def extract_json_array(text: str) -> Optional[list]:
+    """Parse the first JSON array of objects embedded in free-form agent output
+
+    Matches brackets in one forward pass, skipping brackets inside string
+    literals, and tries each outermost array as it closes rather than matching
+    from the first '[' to the last ']' in the text. Arrays nested in a '['
+    that never closes are tried at the end.
+    """
+    open_at = []  # positions of '[' not yet closed
+    enclosed = []  # (depth, start, end) of closed arrays inside a still-open '['
+    in_string = False
+    escaped_at = -1
+    for token in JSON_TOKEN_PATTERN.finditer(text):
+        position = token.start()
+        char = token.group()
+        if position == escaped_at:
+            continue
+        if in_string:
+            if char == '\\':
+                escaped_at = position + 1
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            # Quotes in prose outside any array are not string delimiters
+            in_string = bool(open_at)
+        elif char == '[':
+            open_at.append(position)
+        elif open_at:
+            start = open_at.pop()
+            depth = len(open_at)
+            # Arrays closed earlier at a deeper level lie inside this one
+            children = []
+            while enclosed and enclosed[-1][0] > depth:
+                child = enclosed.pop()
+                if child[0] == depth + 1:
+                    children.append(child)
+            if depth == 0:
+                parsed = load_object_array(text[start:position + 1])
+                # An outer array of other values may hold the object array
+                for _, child_start, child_end in reversed(children):
+                    if parsed is not None:
+                        break
+                    parsed = load_object_array(text[child_start:child_end + 1])
+                if parsed is not None:
+                    return parsed
+            else:
+                enclosed.append((depth, start, position))
+
+    for _, start, end in enclosed:
+        parsed = load_object_array(text[start:end + 1])
+        if parsed is not None:
+            return parsed
+    return None
+
+# Strong references to fire-and-forget tasks so they are not garbage collected
+background_tasks: set = set()
+
+def run_in_background(coro, description: str) -> None:
+    """Schedule a coroutine without awaiting it, logging any failure"""
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+
+    def on_done(done: asyncio.Task):
+        background_tasks.discard(done)
+        if not done.cancelled() and done.exception():
+            logger.warning(f"Background task failed ({description}): {done.exception()}")
+
+    task.add_done_callback(on_done)
+
 # Global agent instance
 agent = None
 
+IMAGE_REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
 async def initialize_agent():
     """Initialize the deep agent with MCP tools"""
     global agent
@@ -266,16 +455,79 @@ async def initialize_agent():
         logger.error(f"Failed to initialize agent: {e}")
         raise e
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize the agent and database on startup"""
-    await initialize_agent()
-    await db_service.initialize()
+# Agent responses for recently seen requests. The in-process LRU answers hot
+# keys without a database round-trip; TimescaleDB shares hits across workers.
+AGENT_CACHE_TTL = 120  # seconds
+AGENT_CACHE_SIZE = 256
+agent_response_cache: "OrderedDict[str, tuple]" = OrderedDict()
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup resources on shutdown"""
-    await db_service.close()
+# Agent calls currently running, by request hash. Concurrent identical requests
+# wait on the first one instead of starting their own.
+agent_inflight: Dict[str, asyncio.Task] = {}
+
+async def cached_agent_invoke(key: str, prompt: str, ttl: int = AGENT_CACHE_TTL,
+                              refresh: bool = False) -> Optional[str]:
+    """Run the agent on a single-message prompt, reusing a recent response for the same key
+
+    Returns the final message content, or None if the agent produced no messages.
+    Pass refresh=True to skip the cache lookup and always call the agent.
+    """
+    query_hash = hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+    if not refresh:
+        entry = agent_response_cache.get(query_hash)
+        if entry and entry[0] > time.monotonic():
+            agent_response_cache.move_to_end(query_hash)
+            return entry[1]
+
+    task = agent_inflight.get(query_hash)
+    if task is None:
+        # The call runs in its own task so that a caller disconnecting cancels
+        # only its own wait, not the call the other callers are waiting on
+        task = asyncio.create_task(_load_agent_response(query_hash, prompt, ttl, refresh))
+        if not task.done():
+            agent_inflight[query_hash] = task
+
+            def on_done(done: asyncio.Task):
+                if agent_inflight.get(query_hash) is done:
+                    del agent_inflight[query_hash]
+                if not done.cancelled():
+                    done.exception()  # waiters re-raise it; don't log it as unretrieved
+
+            task.add_done_callback(on_done)
+
+    return await asyncio.shield(task)
+
+async def _load_agent_response(query_hash: str, prompt: str, ttl: int,
+                               refresh: bool) -> Optional[str]:
+    """Fetch a response from the shared cache or the agent, and remember it locally"""
+    cached = None
+    if not refresh:
+        cached = await db_service.get_cached_agent_response(query_hash)
+
+    if cached is not None:
+        # Expire locally when the shared row does, not a full ttl from now
+        content, ttl = cached
+    else:
+        response = await agent.ainvoke({
+            "messages": [{"role": "user", "content": prompt}]
+        })
+        if not response.get("messages"):
+            return None
+        content = response["messages"][-1].content
+        if isinstance(content, str):
+            await db_service.cache_agent_response(query_hash, content, ttl)
+
+    agent_response_cache[query_hash] = (time.monotonic() + ttl, content)
+    agent_response_cache.move_to_end(query_hash)
+    if len(agent_response_cache) > AGENT_CACHE_SIZE:
+        agent_response_cache.popitem(last=False)
+
+    return content
+
+def get_http(request: Request) -> aiohttp.ClientSession:
+    """Dependency returning the app-wide HTTP client session"""
+    return request.app.state.http
 
 @app.get("/")
 async def root():
@@ -283,7 +535,11 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "agent_ready": agent is not None}
+    return {
+        "status": "healthy",
+        "agent_ready": agent is not None,
+        "db_pool_acquire_timeouts": db_service.pool_acquire_timeouts
+    }
 
 @app.post("/query")
 async def query_events(request: QueryRequest):
@@ -292,12 +548,9 @@ async def query_events(request: QueryRequest):
         raise HTTPException(status_code=500, detail="Agent not initialized")
 
     try:
-        response = await agent.ainvoke(
-            {"messages": [{"role": "user", "content": request.query}]}
-        )
-
-        # Extract the final message content
-        final_message = response["messages"][-1].content if response.get("messages") else "No response generated"
+        final_message = await cached_agent_invoke(f"query|{request.query}", request.query)
+        if final_message is None:
+            final_message = "No response generated"
 
         return {
             "query": request.query,
@@ -309,13 +562,17 @@ async def query_events(request: QueryRequest):
         logger.error(f"Error processing query: {e}")
         raise HTTPException(status_code=500, detail=f"Error processing query: {str(e)}")
 
+async def send_ws_json(websocket: WebSocket, message: dict):
+    """Send a message as an orjson-encoded text frame (clients JSON.parse the frame)"""
+    await websocket.send_text(orjson.dumps(message).decode())
+
 @app.websocket("/ws/query")
 async def websocket_query(websocket: WebSocket):
     """WebSocket endpoint for streaming event queries"""
     await websocket.accept()
 
     if not agent:
-        await websocket.send_json({
+        await send_ws_json(websocket, {
             "type": "error",
             "message": "Agent not initialized"
         })
@@ -326,24 +583,27 @@ async def websocket_query(websocket: WebSocket):
         while True:
             # Receive query from client
             data = await websocket.receive_text()
-            query_data = json.loads(data)
+            query_data = orjson.loads(data)
             query = query_data.get("query", "")
 
             if not query:
-                await websocket.send_json({
+                await send_ws_json(websocket, {
                     "type": "error",
                     "message": "Query is required"
                 })
                 continue
 
             # Send acknowledgment
-            await websocket.send_json({
+            await send_ws_json(websocket, {
                 "type": "start",
                 "message": "Processing your query...",
                 "query": query
             })
 
             try:
+                # Characters of each message already sent, keyed by message id
+                sent_lengths = {}
+
                 # Stream the agent response
                 async for chunk in agent.astream(
                     {"messages": [{"role": "user", "content": query}]},
@@ -351,23 +611,35 @@ async def websocket_query(websocket: WebSocket):
                 ):
                     if "messages" in chunk and chunk["messages"]:
                         latest_message = chunk["messages"][-1]
-
-                        # Send the streaming content
-                        await websocket.send_json({
+                        content = latest_message.content
+                        message = {
                             "type": "stream",
-                            "content": latest_message.content if hasattr(latest_message, 'content') else str(latest_message),
+                            "message_id": getattr(latest_message, 'id', None) or str(len(chunk["messages"]) - 1),
                             "role": getattr(latest_message, 'role', 'assistant')
-                        })
+                        }
+
+                        # Send only text the client has not seen yet; clients append
+                        # deltas per message_id. Structured content is sent whole.
+                        if isinstance(content, str):
+                            sent = sent_lengths.get(message["message_id"], 0)
+                            if len(content) <= sent:
+                                continue
+                            sent_lengths[message["message_id"]] = len(content)
+                            message["delta"] = content[sent:]
+                        else:
+                            message["content"] = content
+
+                        await send_ws_json(websocket, message)
 
                 # Send completion signal
-                await websocket.send_json({
+                await send_ws_json(websocket, {
                     "type": "complete",
                     "message": "Query processing completed"
                 })
 
             except Exception as e:
                 logger.error(f"Error during streaming: {e}")
-                await websocket.send_json({
+                await send_ws_json(websocket, {
                     "type": "error",
                     "message": f"Error processing query: {str(e)}"
                 })
@@ -377,7 +649,7 @@ async def websocket_query(websocket: WebSocket):
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
         try:
-            await websocket.send_json({
+            await send_ws_json(websocket, {
                 "type": "error",
                 "message": f"WebSocket error: {str(e)}"
             })
@@ -401,6 +673,9 @@ async def get_latest_news(
         use_cache: Use cached data if available (default: True)
     """
     try:
+        # One timestamp per request for the response and every parsed article
+        now_iso = datetime.now().isoformat()
+
         # Validate limit parameter - default to 5 for performance
         if limit < 1:
             limit = 1
@@ -425,7 +700,7 @@ async def get_latest_news(
                         'status': 'success',
                         'data': cached_news,
                         'total': len(cached_news),
-                        'timestamp': datetime.now().isoformat(),
+                        'timestamp': now_iso,
                         'category': category,
                         'breaking_only': breaking_only,
                         'source': 'TimescaleDB Cache',
@@ -438,32 +713,23 @@ async def get_latest_news(
             logger.error("BrightData agent not initialized")
             raise HTTPException(status_code=503, detail="BrightData agent not available. Cannot fetch real news data.")
         else:
-            # Use the agent to search for real news
-            search_query = f"latest news {category if category else 'general'} articles today"
-
             try:
                 # Use the agent to search for real news
-                search_query = f"latest {category if category else 'technology'} news articles today"
-                response = await agent.ainvoke({
-                    "messages": [{"role": "user", "content": f"Search for the latest {category if category else 'technology'} news articles. Use the search_engine tool to find recent news articles from reliable sources. Return exactly {limit} real articles with actual titles, URLs, sources, and summaries. Format the response as a JSON array with fields: title, url, source, summary, publishedAt, category."}]
-                })
+                agent_response = await cached_agent_invoke(
+                    f"latest|{category}|{limit}",
+                    latest_news_prompt(category, limit),
+                    refresh=not use_cache
+                )
 
                 # Extract and parse the real response from the agent
-                if response.get("messages") and len(response["messages"]) > 0:
-                    agent_response = response["messages"][-1].content
+                if agent_response is not None:
                     logger.info(f"Agent response received: {len(agent_response)} characters")
                     logger.info(f"Raw agent response: {agent_response[:500]}...")
 
                     try:
                         # Try to parse JSON from agent response
-                        import re
-                        import json
-
-                        # Look for JSON in the response
-                        json_match = re.search(r'\[.*\]', agent_response, re.DOTALL)
-                        if json_match:
-                            parsed_articles = json.loads(json_match.group())
-
+                        parsed_articles = extract_json_array(agent_response)
+                        if parsed_articles is not None:
                             news_data = []
                             for i, article in enumerate(parsed_articles[:limit]):  # Limit to requested amount
                                 news_item = {
@@ -472,7 +738,7 @@ async def get_latest_news(
                                     "summary": article.get("summary", "Summary not available"),
                                     "url": article.get("url", ""),
                                     "source": article.get("source", "BrightData Search"),
-                                    "publishedAt": article.get("publishedAt", datetime.now().isoformat()),
+                                    "publishedAt": article.get("publishedAt", now_iso),
                                     "category": article.get("category", category or "general"),
                                     "sentiment": "neutral",
                                     "trending_potential": 75,
@@ -488,13 +754,11 @@ async def get_latest_news(
                                 }
                                 news_data.append(news_item)
 
-                                # Cache the article in TimescaleDB
-                                try:
-                                    await db_service.cache_news_article(news_item)
-                                except Exception as cache_error:
-                                    logger.warning(f"Failed to cache article: {cache_error}")
+                            # Cache the articles in TimescaleDB without holding up the response
+                            run_in_background(db_service.cache_news_articles_bulk(news_data),
+                                              "cache fetched articles")
 
-                            logger.info(f"Parsed and cached {len(news_data)} real articles from agent")
+                            logger.info(f"Parsed {len(news_data)} real articles from agent; caching scheduled")
                         else:
                             # If no JSON found, parse text response
                             logger.info("No JSON found, parsing text response")
@@ -503,7 +767,8 @@ async def get_latest_news(
 
                             current_article = {}
                             for line in lines:
-                                if 'title:' in line.lower() or 'headline:' in line.lower():
+                                line_lower = line.lower()
+                                if 'title:' in line_lower or 'headline:' in line_lower:
                                     if current_article:
                                         news_data.append(current_article)
                                     current_article = {
@@ -512,7 +777,7 @@ async def get_latest_news(
                                         "summary": "Summary extracted from real search",
                                         "url": "",
                                         "source": "BrightData Real Search",
-                                        "publishedAt": datetime.now().isoformat(),
+                                        "publishedAt": now_iso,
                                         "category": category or "general",
                                         "sentiment": "neutral",
                                         "trending_potential": 80,
@@ -521,13 +786,13 @@ async def get_latest_news(
                                         "agent_searched": True,
                                         "is_real_data": True
                                     }
-                                elif 'url:' in line.lower() or 'link:' in line.lower():
+                                elif 'url:' in line_lower or 'link:' in line_lower:
                                     if current_article and ':' in line:
                                         current_article["url"] = line.split(':', 1)[1].strip()
-                                elif 'source:' in line.lower():
+                                elif 'source:' in line_lower:
                                     if current_article and ':' in line:
                                         current_article["source"] = line.split(':', 1)[1].strip()
-                                elif 'summary:' in line.lower() or 'description:' in line.lower():
+                                elif 'summary:' in line_lower or 'description:' in line_lower:
                                     if current_article and ':' in line:
                                         current_article["summary"] = line.split(':', 1)[1].strip()
 
@@ -547,7 +812,7 @@ async def get_latest_news(
                             "summary": f"BrightData agent searched for {category or 'general'} news. Raw response: {agent_response[:200]}...",
                             "url": "https://brightdata.com",
                             "source": "BrightData Agent",
-                            "publishedAt": datetime.now().isoformat(),
+                            "publishedAt": now_iso,
                             "category": category or "general",
                             "sentiment": "neutral",
                             "trending_potential": 85,
@@ -575,7 +840,7 @@ async def get_latest_news(
             'status': 'success',
             'data': news_data,
             'total': len(news_data),
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now_iso,
             'category': category,
             'breaking_only': breaking_only,
             'source': 'BrightData Agent' if agent else 'Mock Data'
@@ -603,6 +868,9 @@ async def search_news(
         language: Language code (default: en)
     """
     try:
+        # One timestamp per request for the response and every parsed article
+        now_iso = datetime.now().isoformat()
+
         # Validate limit parameter
         if limit < 1:
             limit = 1
@@ -617,29 +885,19 @@ async def search_news(
         else:
             try:
                 # Use the agent to search for specific news
-                search_prompt = f"Search for news articles about: {query}"
-                if category:
-                    search_prompt += f" in the {category} category"
-                search_prompt += f". Use the search_engine tool to find exactly {limit} real articles. Return structured JSON data with fields: title, url, source, summary, publishedAt, category."
-
-                response = await agent.ainvoke({
-                    "messages": [{"role": "user", "content": search_prompt}]
-                })
+                agent_response = await cached_agent_invoke(
+                    f"search|{query}|{category}|{limit}",
+                    search_news_prompt(query, category, limit)
+                )
 
-                if response.get("messages") and len(response["messages"]) > 0:
-                    agent_response = response["messages"][-1].content
+                if agent_response is not None:
                     logger.info(f"Agent search response received: {len(agent_response)} characters")
                     logger.info(f"Search response preview: {agent_response[:300]}...")
 
                     # Parse the real search results
                     try:
-                        import re
-                        import json
-
-                        # Look for JSON in the response
-                        json_match = re.search(r'\[.*\]', agent_response, re.DOTALL)
-                        if json_match:
-                            parsed_articles = json.loads(json_match.group())
+                        parsed_articles = extract_json_array(agent_response)
+                        if parsed_articles is not None:
                             search_results = []
 
                             for i, article in enumerate(parsed_articles[:limit]):  # Limit to requested amount
@@ -649,7 +907,7 @@ async def search_news(
                                     "summary": article.get("summary", "Summary extracted from search"),
                                     "url": article.get("url", ""),
                                     "source": article.get("source", "BrightData Search"),
-                                    "publishedAt": article.get("publishedAt", datetime.now().isoformat()),
+                                    "publishedAt": article.get("publishedAt", now_iso),
                                     "category": article.get("category", category or "general"),
                                     "sentiment": "neutral",
                                     "trending_potential": 80,
@@ -667,8 +925,10 @@ async def search_news(
                             lines = agent_response.split('\n')
 
                             current_article = {}
+                            title_markers = ('title:', 'headline:', query.lower())
                             for line in lines:
-                                if any(keyword in line.lower() for keyword in ['title:', 'headline:', f'{query.lower()}']):
+                                line_lower = line.lower()
+                                if any(keyword in line_lower for keyword in title_markers):
                                     if current_article:
                                         search_results.append(current_article)
                                     current_article = {
@@ -677,7 +937,7 @@ async def search_news(
                                         "summary": f"Search result for '{query}'",
                                         "url": "",
                                         "source": "BrightData Search",
-                                        "publishedAt": datetime.now().isoformat(),
+                                        "publishedAt": now_iso,
                                         "category": category or "search",
                                         "sentiment": "neutral",
                                         "trending_potential": 85,
@@ -687,7 +947,7 @@ async def search_news(
                                         "search_query": query,
                                         "is_real_data": True
                                     }
-                                elif current_article and ('url:' in line.lower() or 'link:' in line.lower()) and ':' in line:
+                                elif current_article and ('url:' in line_lower or 'link:' in line_lower) and ':' in line:
                                     current_article["url"] = line.split(':', 1)[1].strip()
 
                             if current_article:
@@ -704,7 +964,7 @@ async def search_news(
                             "summary": f"BrightData agent searched for: {query}. Raw response: {agent_response[:200]}...",
                             "url": "https://brightdata.com",
                             "source": "BrightData Search Agent",
-                            "publishedAt": datetime.now().isoformat(),
+                            "publishedAt": now_iso,
                             "category": category or "search",
                             "sentiment": "neutral",
                             "trending_potential": 90,
@@ -733,7 +993,7 @@ async def search_news(
                 item['relevance_score'] = 95
             elif query_lower in item['summary'].lower():
                 item['relevance_score'] = 85
-            elif any(query_lower in tag.lower() for tag in item.get('tags', [])):
+            elif any(query_lower in tag.lower() for tag in item.get('tags') or ()):
                 item['relevance_score'] = 75
             else:
                 item['relevance_score'] = 70
@@ -744,7 +1004,7 @@ async def search_news(
             'total': len(filtered_results),
             'query': query,
             'category': category,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now_iso,
             'source': 'BrightData Agent' if agent else 'Mock Data'
         }
 
@@ -753,40 +1013,32 @@ async def search_news(
         raise HTTPException(status_code=500, detail=f"Failed to search news: {str(e)}")
 
 @app.get("/api/proxy-image")
-async def proxy_image(url: str = Query(..., description="Image URL to proxy")):
+async def proxy_image(url: str = Query(..., description="Image URL to proxy"),
+                      http: aiohttp.ClientSession = Depends(get_http)):
     """Proxy image requests to handle CORS and accessibility issues"""
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
+        async with http.get(url, headers=IMAGE_REQUEST_HEADERS) as response:
+            if response.status != 200:
+                raise HTTPException(status_code=response.status, detail=f"Failed to fetch image: {response.status}")
             
-            async with session.get(url, headers=headers) as response:
-                if response.status != 200:
-                    raise HTTPException(status_code=response.status, detail=f"Failed to fetch image: {response.status}")
-                
-                content_type = response.headers.get('content-type', 'image/jpeg')
-                content = await response.read()
-                
-                return StreamingResponse(
-                    iter([content]),
-                    media_type=content_type,
-                    headers={"Cache-Control": "public, max-age=3600"}
-                )
+            content_type = response.headers.get('content-type', 'image/jpeg')
+            content = await response.read()
+            
+            return StreamingResponse(
+                iter([content]),
+                media_type=content_type,
+                headers={"Cache-Control": "public, max-age=3600"}
+            )
     except Exception as e:
         logger.error(f"Error proxying image {url}: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to proxy image: {str(e)}")
 
-async def validate_image_url(url: str) -> bool:
+async def validate_image_url(url: str, http: aiohttp.ClientSession) -> bool:
     """Validate if an image URL is accessible"""
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            async with session.head(url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                return response.status == 200 and 'image' in response.headers.get('content-type', '')
+        async with http.head(url, headers=IMAGE_REQUEST_HEADERS,
+                             timeout=aiohttp.ClientTimeout(total=10)) as response:
+            return response.status == 200 and 'image' in response.headers.get('content-type', '')
     except Exception as e:
         logger.warning(f"Image validation failed for {url}: {e}")
         return False
@@ -801,11 +1053,11 @@ def preprocess_amazon_url(url: str) -> str:
         return url.replace('__AC_SX300_SY300_QL70_FMwebp_', '_AC_SL1500_')
     
     # Try to get a larger, more standard format
-    import re
-    return re.sub(r'\._AC_[^.]*\.', '._AC_SL1500_.', url)
+    return AMAZON_SIZE_PATTERN.sub('._AC_SL1500_.', url)
 
 @app.post("/api/generate-video")
-async def generate_video(request: VideoGenerationRequest) -> VideoGenerationResponse:
+async def generate_video(request: VideoGenerationRequest,
+                         http: aiohttp.ClientSession = Depends(get_http)) -> VideoGenerationResponse:
     """Generate video from product data and configuration"""
     try:
         logger.info(f"Received video generation request for product: {request.productData.get('title', 'Unknown')}")
@@ -822,11 +1074,11 @@ async def generate_video(request: VideoGenerationRequest) -> VideoGenerationResp
         processed_url = preprocess_amazon_url(product_image_url)
         
         # Validate image accessibility
-        is_valid = await validate_image_url(processed_url)
+        is_valid = await validate_image_url(processed_url, http)
         if not is_valid:
             # Try original URL if processed version fails
             if processed_url != product_image_url:
-                is_valid = await validate_image_url(product_image_url)
+                is_valid = await validate_image_url(product_image_url, http)
                 if is_valid:
                     processed_url = product_image_url
         
@@ -897,16 +1149,18 @@ async def get_trending_topics(
         topics = ['AI Revolution', 'Web3 Development', 'Remote Work', 'Climate Tech', 'Blockchain Innovation',
                  'Machine Learning', 'Digital Photography', 'UX Design Trends', 'Startup Funding', 'Tech Layoffs']
 
+        last_updated = datetime.now().isoformat()
+        choice, randint = rng.choice, rng.randint
         for i, topic in enumerate(topics[:limit]):
             trending_item = {
                 'id': str(uuid.uuid4()),
                 'topic': topic,
-                'category': category if category else random.choice(['technology', 'ai', 'business']),
-                'trending_score': random.randint(70, 95),
-                'mention_count': random.randint(100, 5000),
-                'sentiment_score': random.randint(60, 90),
+                'category': category if category else choice(['technology', 'ai', 'business']),
+                'trending_score': randint(70, 95),
+                'mention_count': randint(100, 5000),
+                'sentiment_score': randint(60, 90),
                 'timeframe': timeframe,
-                'last_updated': datetime.now().isoformat()
+                'last_updated': last_updated
             }
             trending_topics.append(trending_item)
 
@@ -916,9 +1170,9 @@ async def get_trending_topics(
                 'trending_topics': trending_topics,
                 'total_topics': len(trending_topics),
                 'timeframe': timeframe,
-                'last_updated': datetime.now().isoformat()
+                'last_updated': last_updated
             },
-            'timestamp': datetime.now().isoformat()
+            'timestamp': last_updated
         }
 
     except Exception as e:
@@ -947,18 +1201,20 @@ async def get_social_hooks(
         social_hooks = []
         categories = ['AI', 'Design', 'Marketing', 'Tech', 'Business']
 
+        now = datetime.now()
+        choice, randint = rng.choice, rng.randint
         for i in range(limit):
-            category = random.choice(categories)
-            template = random.choice(hook_templates)
+            category = choice(categories)
+            template = choice(hook_templates)
             hook = {
                 'id': str(uuid.uuid4()),
                 'hook_text': template.format(category),
-                'platform': random.choice(platform_list),
+                'platform': choice(platform_list),
                 'category': category.lower(),
-                'engagement_potential': random.randint(min_engagement_potential, 95),
-                'optimal_post_time': (datetime.now() + timedelta(hours=random.randint(1, 24))).isoformat(),
-                'difficulty': random.choice(['easy', 'medium', 'hard']),
-                'estimated_reach': random.randint(1000, 50000)
+                'engagement_potential': randint(min_engagement_potential, 95),
+                'optimal_post_time': (now + timedelta(hours=randint(1, 24))).isoformat(),
+                'difficulty': choice(['easy', 'medium', 'hard']),
+                'estimated_reach': randint(1000, 50000)
             }
             social_hooks.append(hook)
 
@@ -970,7 +1226,7 @@ async def get_social_hooks(
                 'platforms': platform_list,
                 'min_engagement_potential': min_engagement_potential
             },
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now.isoformat()
         }
 
     except Exception as e:
@@ -1056,42 +1312,52 @@ async def generate_social_content_from_news(request_data: dict):
             raise HTTPException(status_code=404, detail="No cached news found for content generation")
 
         generated_content = []
+        category_tag = HASHTAG_STRIP_PATTERN.sub('', category or '') or 'general'
+        hashtags = [category or 'news', 'ai', 'trending']
+        now = datetime.now()
+        template, max_length = SOCIAL_POST_FORMATS.get(platform, SOCIAL_POST_FORMATS['instagram'])
 
         for news_item in cached_news:
+            # Article fragments shared by every platform template
+            title = news_item['title']
+            summary = news_item.get('summary') or ''
+            fragments = {
+                'title': title,
+                'title_100': title[:100],
+                'summary': summary,
+                'summary_120': summary[:120],
+                'category_tag': category_tag
+            }
+
             # Generate social media content based on news
-            if platform == 'twitter':
-                content_text = f"🚀 {news_item['title'][:100]}... \n\n{news_item.get('summary', '')[:120]}... \n\n#AI #News #Tech"
-                max_length = 280
-            elif platform == 'linkedin':
-                content_text = f"📰 Industry Update: {news_item['title']}\n\n{news_item.get('summary', '')}\n\nThoughts? 💭\n\n#Industry #Business #Innovation"
-                max_length = 3000
-            else:  # Instagram
-                content_text = f"📊 {news_item['title']}\n.\n.\n.\n#news #trending #industry #{category or 'general'}"
-                max_length = 2200
+            content_text = template.format_map(fragments)
 
             # Trim content if necessary
             if len(content_text) > max_length:
                 content_text = content_text[:max_length-3] + "..."
 
             # Schedule for posting (e.g., next 24 hours)
-            scheduled_time = datetime.now() + timedelta(hours=random.randint(1, 24))
+            scheduled_time = now + timedelta(hours=rng.randint(1, 24))
 
             social_content = {
                 'content_id': str(uuid.uuid4()),
                 'platform': platform,
                 'content_type': 'post',
-                'title': news_item['title'][:100],
+                'title': fragments['title_100'],
                 'content_text': content_text,
-                'hashtags': [category or 'news', 'ai', 'trending'],
+                'hashtags': hashtags,
                 'scheduled_time': scheduled_time.isoformat(),
                 'ai_generated': True,
                 'source_news_id': news_item.get('id')
             }
+            generated_content.append(social_content)
 
-            # Schedule the content
-            content_id = await db_service.schedule_social_content(social_content)
+        # Schedule all posts concurrently; each insert is an independent round-trip
+        content_ids = await asyncio.gather(
+            *(db_service.schedule_social_content(social_content) for social_content in generated_content)
+        )
+        for social_content, content_id in zip(generated_content, content_ids):
             social_content['id'] = content_id
-            generated_content.append(social_content)
 
         return {
             'status': 'success',
@@ -1099,7 +1365,7 @@ async def generate_social_content_from_news(request_data: dict):
             'total': len(generated_content),
             'platform': platform,
             'source_news_count': len(cached_news),
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now.isoformat()
         }
 
     except Exception as e:
@@ -1199,4 +1465,9 @@ if __name__ == "__main__":
     host = os.getenv("HOST", "0.0.0.0")
     
     logger.info(f"🚀 Starting Event Hunter API on {host}:{port}")
-    uvicorn.run(app, host=host, port=port, reload=True)
\ No newline at end of file
+    uvicorn.run(
+        "main:app",
+        host=host,
+        port=port,
+        reload=True
+    )
\ No newline at end of file